@@ -1,10 +1,144 @@
-"""Access the database via the `engine` variable provided in this module"""
-from sqlalchemy import create_engine
+"""Access the database via the `engine` variable provided in this module
+
+Both engines are created on first access, so importing this module does not
+read the environment or load SQLAlchemy dialects until they are needed.
+
+- `engine`: Production database
+- `engine_staged`: Intermediate storage for review
+"""
+import csv
+from functools import lru_cache
+from io import StringIO
+from sqlalchemy import create_engine, event, make_url
 import os
 from dotenv import load_dotenv
 
-load_dotenv()
-engine = create_engine(os.environ['DB_URL'])
-"""Production database"""
-engine_staged = create_engine('sqlite:///staged_data.db')
-"""Intermediate storage for review"""
\ No newline at end of file
+
+@lru_cache(maxsize=None)
+def _get_engine():
+    """Production database"""
+    load_dotenv()
+    url = make_url(os.environ['DB_URL'])
+    driver_options = {}
+    if url.get_driver_name() == 'psycopg2':
+        # Batch executemany() for UPDATE/DELETE too, not only INSERT
+        driver_options = {
+            'executemany_mode': 'values_plus_batch',
+            'executemany_batch_page_size': 1000,
+        }
+    return create_engine(
+        url,
+        pool_size=16,
+        max_overflow=32,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        query_cache_size=2048,
+        **driver_options,
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_engine_staged():
+    """Intermediate storage for review"""
+    engine_staged = create_engine(
+        'sqlite:///staged_data.db',
+        connect_args={'check_same_thread': False},
+    )
+    event.listen(engine_staged, 'connect', _set_sqlite_pragmas)
+    return engine_staged
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL journaling so bulk staging inserts don't fsync every commit"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.close()
+
+
+def bulk_stage(table, rows, chunk=1000):
+    """Insert many rows into the staging database in one transaction.
+
+    Each chunk is sent as a single executemany instead of one INSERT per row.
+
+    Args:
+        table (sqlalchemy.Table): Table in the staging database
+        rows (list[dict]): Rows to insert, keyed by column name
+        chunk (int, optional): Rows per executemany batch. Defaults to 1000.
+    """
+    with _get_engine_staged().begin() as conn:
+        for i in range(0, len(rows), chunk):
+            conn.execute(table.insert(), rows[i:i + chunk])
+
+
+_COPY_NULL = '\\N'
+
+
+def copy_insert(table, conn, keys, data_iter):
+    r"""`pandas.DataFrame.to_sql` method that loads rows with PostgreSQL COPY.
+
+    Streams every row through one ``COPY ... FROM STDIN`` instead of
+    INSERT statements. Only usable on PostgreSQL connections made with the
+    psycopg2 driver (it relies on ``cursor.copy_expert``).
+
+    Missing values are written as ``\N`` so empty strings stay empty strings,
+    matching the INSERT path. A string value that is exactly ``\N`` is
+    loaded as NULL.
+
+    Args:
+        table (pandas.io.sql.SQLTable): Table being written to
+        conn (sqlalchemy.engine.Connection): Connection to write with
+        keys (list[str]): Column names
+        data_iter (Iterable[tuple]): Row values
+
+    Returns:
+        int: Number of rows copied
+
+    Examples:
+        ``''`` is written as an empty field, while ``None`` and the literal
+        string ``'\N'`` are both written as the NULL marker:
+
+        >>> from types import SimpleNamespace
+        >>> class Cursor:
+        ...     rowcount = 3
+        ...     def copy_expert(self, sql, file):
+        ...         print(sql)
+        ...         print(file.read().splitlines())
+        ...     def close(self):
+        ...         pass
+        >>> conn = SimpleNamespace(connection=SimpleNamespace(cursor=Cursor))
+        >>> table = SimpleNamespace(schema=None, name='players')
+        >>> copy_insert(table, conn, ['name', 'nick'], [('a', ''), ('b', None), ('c', '\\N')])
+        COPY "players" ("name", "nick") FROM STDIN WITH (FORMAT csv, NULL '\N')
+        ['a,', 'b,\\N', 'c,\\N']
+        3
+    """
+    buffer = StringIO()
+    csv.writer(buffer).writerows(
+        [_COPY_NULL if value is None else value for value in row] for row in data_iter
+    )
+    buffer.seek(0)
+
+    columns = ', '.join(f'"{key}"' for key in keys)
+    table_name = f'"{table.schema}"."{table.name}"' if table.schema else f'"{table.name}"'
+    cursor = conn.connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '{_COPY_NULL}')",
+            buffer,
+        )
+        return cursor.rowcount
+    finally:
+        cursor.close()
+
+
+_ENGINES = {
+    'engine': _get_engine,
+    'engine_staged': _get_engine_staged,
+}
+
+
+def __getattr__(name):
+    if name in _ENGINES:
+        return _ENGINES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,7 +13,10 @@ extensions = [
 ]
 
 templates_path = ['_templates']
-exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store', 'nba_scraper.rst']
+exclude_patterns = [
+    '_build', '.doctrees', 'Thumbs.db', '.DS_Store', 'nba_scraper.rst',
+    '**/__pycache__', '**/.ipynb_checkpoints',
+]
 
 html_theme = 'sphinx_rtd_theme'
 html_static_path = ['_static']
@@ -43,16 +46,24 @@ doctest_default_flags = (
 )
 
 # Custom processing to clean up all nba_scraper references
+_NBA_PREFIX = 'nba_scraper.'
+
+def _strip_prefix(text):
+    """Remove the nba_scraper prefix, only building a new string on a hit"""
+    if _NBA_PREFIX in text:
+        return text.replace(_NBA_PREFIX, '')
+    return text
+
 def process_signature(app, what, name, obj, options, signature, return_annotation):
     """Remove nba_scraper prefix from module names in signatures"""
     if signature:
-        signature = signature.replace('nba_scraper.', '')
+        signature = _strip_prefix(signature)
     return signature, return_annotation
 
 def process_docstring(app, what, name, obj, options, lines):
     """Clean up module references in docstrings"""
     for i, line in enumerate(lines):
-        lines[i] = line.replace('nba_scraper.', '')
+        lines[i] = _strip_prefix(line)
 
 def skip_member(app, what, name, obj, skip, options):
     """Control which members to document"""
@@ -1,5 +1,8 @@
 """Example module showing doctests with Sphinx integration."""
 
+import numpy as np
+
+
 def calculate_player_efficiency(points, minutes, games):
     """Calculate a simple player efficiency metric.
     
@@ -8,7 +11,7 @@ def calculate_player_efficiency(points, minutes, games):
     
     Args:
         points (int): Total points scored
-        minutes (int): Total minutes played  
+        minutes (int | float): Total minutes played  
         games (int): Number of games played
         
     Returns:
@@ -25,6 +28,11 @@ def calculate_player_efficiency(points, minutes, games):
         >>> calculate_player_efficiency(250, 300, 10) 
         0.08333333333333333
         
+        Fractional minutes are supported:
+        
+        >>> calculate_player_efficiency(100, 200.5, 5)
+        0.09975062344139651
+        
         Edge case with zero games (should raise an error):
         
         >>> calculate_player_efficiency(100, 200, 0)
@@ -54,8 +62,55 @@ def calculate_player_efficiency(points, minutes, games):
     return points / (minutes * games)
 
 
+def calculate_player_efficiency_fast(points, minutes, games):
+    """Calculate player efficiency, returning NaN instead of raising.
+
+    Intended for bulk callers that handle missing data themselves; use
+    ``calculate_player_efficiency`` for direct calls.
+
+    Args:
+        points (int): Total points scored
+        minutes (int): Total minutes played
+        games (int): Number of games played
+
+    Returns:
+        float: Efficiency rating, or NaN if minutes or games is zero
+
+    Examples:
+        >>> calculate_player_efficiency_fast(100, 200, 5)
+        0.1
+        >>> calculate_player_efficiency_fast(100, 200, 0)
+        nan
+    """
+    minutes_games = minutes * games
+    return points / minutes_games if minutes_games else float('nan')
+
+
+def calculate_player_efficiency_array(points, minutes, games):
+    """Calculate player efficiency for many players at once.
+
+    Args:
+        points (array-like): Total points scored per player
+        minutes (array-like): Total minutes played per player
+        games (array-like): Number of games played per player
+
+    Returns:
+        numpy.ndarray: Efficiency ratings, NaN where minutes or games is zero
+
+    Examples:
+        >>> calculate_player_efficiency_array([100, 250, 90], [200, 300, 0], [5, 10, 3]).tolist()
+        [0.1, 0.08333333333333333, nan]
+    """
+    points = np.asarray(points, dtype=np.float64)
+    minutes_games = np.multiply(minutes, games, dtype=np.float64)
+    out = np.full(np.broadcast(points, minutes_games).shape, np.nan)
+    return np.divide(points, minutes_games, out=out, where=minutes_games != 0)
+
+
 class PlayerStats:
     """A simple class to demonstrate doctests with class methods."""
+
+    __slots__ = ('name', 'total_points', 'games_played')
     
     def __init__(self, name):
         """Initialize player stats.
@@ -95,12 +150,42 @@ class PlayerStats:
         """
         self.total_points += points
         self.games_played += 1
-    
+
+    def add_game_stats_batch(self, points_array):
+        """Add stats from several games at once.
+
+        Prefer this over repeated ``add_game_stats`` calls when a player's
+        per-game points are already available as a sequence.
+
+        Args:
+            points_array (array-like): Points scored in each game
+
+        Examples:
+            >>> player = PlayerStats("Stephen Curry")
+            >>> player.add_game_stats_batch(np.array([30, 28, 41]))
+            >>> player.total_points
+            99
+            >>> player.games_played
+            3
+            >>> player.add_game_stats_batch([])
+            >>> player.total_points, player.games_played
+            (99, 3)
+            >>> player.add_game_stats_batch([10.5])
+            >>> player.total_points
+            109.5
+        """
+        points_array = np.asarray(points_array)
+        if points_array.size:
+            self.total_points += points_array.sum().item()
+            self.games_played += points_array.size
+
     def average_points(self):
         """Calculate average points per game.
         
         Returns:
-            float: Average points per game, or 0 if no games played
+            float: Average points per game, or 0 if no games played.
+            ``total_points`` is always 0 while ``games_played`` is 0, so
+            dividing by ``games_played or 1`` covers that case.
             
         Examples:
             >>> player = PlayerStats("Michael Jordan")
@@ -111,9 +196,95 @@ class PlayerStats:
             >>> player.average_points()  # TEST: Should be 27.5
             27.5
         """
-        if self.games_played == 0:
-            return 0.0
-        return self.total_points / self.games_played
+        return self.total_points / (self.games_played or 1)
+
+
+class PlayerStatsTable:
+    """Stats for many players stored as parallel NumPy arrays.
+
+    Use this instead of a list of ``PlayerStats`` when aggregating a whole
+    league, so per-player reductions run as single vectorized operations.
+    """
+
+    def __init__(self, names):
+        """Initialize an empty table for the given players.
+
+        Args:
+            names (list[str]): Player names, one row per player
+
+        Examples:
+            >>> table = PlayerStatsTable(["LeBron James", "Kobe Bryant"])
+            >>> table.names.tolist()
+            ['LeBron James', 'Kobe Bryant']
+            >>> table.total_points.tolist()
+            [0.0, 0.0]
+        """
+        self.names = np.array(names, dtype=object)
+        # float64 like PlayerStats, which accepts fractional points
+        self.total_points = np.zeros(len(names), dtype=np.float64)
+        self.games_played = np.zeros(len(names), dtype=np.int32)
+
+    @classmethod
+    def from_players(cls, players):
+        """Build a table from existing ``PlayerStats`` objects.
+
+        Args:
+            players (list[PlayerStats]): Players to copy into the table
+
+        Returns:
+            PlayerStatsTable: Table with one row per player
+
+        Examples:
+            >>> kobe = PlayerStats("Kobe Bryant")
+            >>> kobe.add_game_stats(81)
+            >>> table = PlayerStatsTable.from_players([kobe, PlayerStats("Rookie")])
+            >>> table.total_points.tolist()
+            [81.0, 0.0]
+            >>> table.games_played.tolist()
+            [1, 0]
+            >>> luka = PlayerStats("Luka Doncic")
+            >>> luka.add_game_stats_batch([30.75, 0])
+            >>> PlayerStatsTable.from_players([luka]).average_points().tolist()
+            [15.375]
+        """
+        table = cls([p.name for p in players])
+        table.total_points[:] = [p.total_points for p in players]
+        table.games_played[:] = [p.games_played for p in players]
+        return table
+
+    def add_game_stats(self, player_idx, points):
+        """Add stats from a single game for one player.
+
+        Args:
+            player_idx (int): Row of the player in the table
+            points (int | float): Points scored in the game
+
+        Examples:
+            >>> table = PlayerStatsTable(["Michael Jordan"])
+            >>> table.add_game_stats(0, 30)
+            >>> table.total_points.tolist(), table.games_played.tolist()
+            ([30.0], [1])
+            >>> table.add_game_stats(0, 10.7)
+            >>> table.total_points.tolist()
+            [40.7]
+        """
+        self.total_points[player_idx] += points
+        self.games_played[player_idx] += 1
+
+    def average_points(self):
+        """Calculate average points per game for every player.
+
+        Returns:
+            numpy.ndarray: Average points per game, 0 for players with no games
+
+        Examples:
+            >>> table = PlayerStatsTable(["Michael Jordan", "Rookie"])
+            >>> table.add_game_stats(0, 30)
+            >>> table.add_game_stats(0, 25)
+            >>> table.average_points().tolist()
+            [27.5, 0.0]
+        """
+        return self.total_points / np.maximum(self.games_played, 1)
 
 
 def complex_calculation(player_data):
@@ -142,6 +313,11 @@ def complex_calculation(player_data):
         >>> player_stats  # doctest: +ELLIPSIS
         {...'efficiency': ...}
         
+        Fractional minutes are summed exactly:
+        
+        >>> complex_calculation({'name': 'Luka', 'points': [30, 28], 'minutes': [34.5, 30.5]})['total_minutes']
+        65.0
+        
         Multi-line statement continuation:
         
         >>> efficiency = calculate_player_efficiency(
@@ -131,6 +131,7 @@ def build_documentation() -> bool:
         cmd = [
             sys.executable, "-m", "sphinx.cmd.build",
             "-b", "html",
+            "-j", "auto",
             str(docs_dir),
             str(build_dir)
         ]
@@ -160,6 +161,7 @@ def validate_doctests() -> bool:
         cmd = [
             sys.executable, "-m", "sphinx.cmd.build",
             "-b", "doctest",
+            "-j", "auto",
             str(docs_dir),
             str(doctest_dir)
         ]
@@ -5,7 +5,6 @@ This script shows all custom scripts with their descriptions extracted from
 the docstrings of the associated Python files.
 """
 
-import toml
 import sys
 import ast
 from pathlib import Path
@@ -86,6 +85,8 @@ def main():
     """List all custom scripts defined in pyproject.toml with descriptions from docstrings"""
     parser = argparse.ArgumentParser(description=__doc__)
     args = parser.parse_args()
+    # Imported after argument parsing so -h/--help doesn't need toml
+    import toml
     pyproject_path = Path("pyproject.toml")
     if not pyproject_path.exists():
         print("❌ No pyproject.toml found in current directory")
@@ -103,8 +104,7 @@ def main():
             print("📝 No custom scripts defined in pyproject.toml")
             return
         
-        print("🚀 Available Custom Scripts:")
-        print("=" * 50)
+        lines = ["🚀 Available Custom Scripts:", "=" * 50]
         
         # Group scripts by category
         dev_scripts = []
@@ -122,22 +122,20 @@ def main():
                 other_scripts.append((script_name, desc))
         
         # Display grouped scripts
-        if dev_scripts:
-            print("\n📦 Development Environment:")
-            for name, desc in dev_scripts:
-                print(f"  uv run {name:<15} {desc}")
+        groups = [
+            ("📦 Development Environment:", dev_scripts),
+            ("📚 Documentation Scripts:", doc_scripts),
+            ("🔧 Other Scripts:", other_scripts),
+        ]
+        for heading, group in groups:
+            if group:
+                lines.append(f"\n{heading}")
+                lines.extend(f"  uv run {name:<15} {desc}" for name, desc in group)
         
-        if doc_scripts:
-            print("\n📚 Documentation Scripts:")
-            for name, desc in doc_scripts:
-                print(f"  uv run {name:<15} {desc}")
+        lines.append(f"\n💡 Total: {len(scripts)} custom scripts available")
         
-        if other_scripts:
-            print("\n🔧 Other Scripts:")
-            for name, desc in other_scripts:
-                print(f"  uv run {name:<15} {desc}")
-        
-        print(f"\n💡 Total: {len(scripts)} custom scripts available")
+        # Emit the listing with a single write
+        sys.stdout.write("\n".join(lines) + "\n")
         
     except Exception as e:
         print(f"❌ Error reading pyproject.toml: {e}")
@@ -4,6 +4,21 @@ import fnmatch
 from pathlib import Path
 from .common import ensure_directory_exists, print_success, print_error, print_info
 
+def write_if_changed(path, content):
+    """Write content to path only if it differs from what is already there.
+
+    Leaving unchanged files untouched keeps their mtime, so Sphinx can reuse
+    cached doctrees instead of re-reading every generated page.
+
+    Returns:
+        bool: True if the file was written
+    """
+    path = Path(path)
+    if path.exists() and path.read_text() == content:
+        return False
+    path.write_text(content)
+    return True
+
 def create_sphinx_config():
     """Create Sphinx configuration with autodoc settings"""
     conf_content = '''
@@ -21,7 +36,10 @@ extensions = [
 ]
 
 templates_path = ['_templates']
-exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store', 'nba_scraper.rst']
+exclude_patterns = [
+    '_build', '.doctrees', 'Thumbs.db', '.DS_Store', 'nba_scraper.rst',
+    '**/__pycache__', '**/.ipynb_checkpoints',
+]
 
 html_theme = 'sphinx_rtd_theme'
 html_static_path = ['_static']
@@ -44,16 +62,24 @@ autodoc_typehints = 'description'
 autodoc_typehints_description_target = 'documented'
 
 # Custom processing to clean up all nba_scraper references
+_NBA_PREFIX = 'nba_scraper.'
+
+def _strip_prefix(text):
+    """Remove the nba_scraper prefix, only building a new string on a hit"""
+    if _NBA_PREFIX in text:
+        return text.replace(_NBA_PREFIX, '')
+    return text
+
 def process_signature(app, what, name, obj, options, signature, return_annotation):
     """Remove nba_scraper prefix from module names in signatures"""
     if signature:
-        signature = signature.replace('nba_scraper.', '')
+        signature = _strip_prefix(signature)
     return signature, return_annotation
 
 def process_docstring(app, what, name, obj, options, lines):
     """Clean up module references in docstrings"""
     for i, line in enumerate(lines):
-        lines[i] = line.replace('nba_scraper.', '')
+        lines[i] = _strip_prefix(line)
 
 def skip_member(app, what, name, obj, skip, options):
     """Control which members to document"""
@@ -75,8 +101,7 @@ def setup_sphinx_structure():
     
     # Create conf.py
     conf_path = docs_dir / "conf.py"
-    with open(conf_path, 'w') as f:
-        f.write(create_sphinx_config())
+    write_if_changed(conf_path, create_sphinx_config())
     
     # Create index.rst
     index_content = '''
@@ -103,8 +128,7 @@ Indices and tables
 '''
     
     index_path = docs_dir / "index.rst"
-    with open(index_path, 'w') as f:
-        f.write(index_content.strip())
+    write_if_changed(index_path, index_content.strip())
     
     return docs_dir
 
@@ -233,8 +257,7 @@ def create_rst_file(docs_dir, config):
         for submodule in config['submodules']:
             content += f"   {submodule}\n"
     
-    with open(rst_path, 'w') as f:
-        f.write(content)
+    write_if_changed(rst_path, content)
 
 def generate_api_docs():
     """Generate API documentation from discovered packages"""
@@ -285,8 +308,7 @@ def create_dynamic_modules_index(docs_dir, packages):
         modules_content += f"   {file_stem}\n"
     
     modules_path = docs_dir / "modules.rst"
-    with open(modules_path, 'w') as f:
-        f.write(modules_content)
+    write_if_changed(modules_path, modules_content)
     
     print_success(f"Created modules index with {len(module_files)} modules")
 
@@ -319,8 +341,7 @@ def update_module_file_title(rst_file, clean_name):
 '''
             
             # Write back the updated content
-            with open(rst_file, 'w') as f:
-                f.write(updated_content)
+            write_if_changed(rst_file, updated_content)
                 
     except Exception:
         # If we can't update, that's okay - the file will still work
@@ -2,8 +2,22 @@
 # TODO define handy "get last processed html/staged/persisted data?"
 from statbucket.scraping.utils import html_cache_path
 from abc import ABC, abstractmethod
+import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
-from database import engine, engine_staged
+import requests
+from requests.adapters import HTTPAdapter
+from sqlalchemy import text
+import database
+
+_MAX_DOWNLOAD_WORKERS = 8
+"""Default number of concurrent page downloads"""
+_INSERT_CHUNK_SIZE = 1000
+"""Rows sent per multi-row INSERT when persisting"""
+_IDENTIFIER_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+"""Table names that are safe to format into SQL"""
 
 
 class BaseScraper(ABC):
@@ -14,11 +28,62 @@ class BaseScraper(ABC):
             base_url (str): The common part of the url for all pages being
                 scraped for this class
             table_name (str): The database table name where it is being saved
+
+        Raises:
+            ValueError: If table_name is not a plain SQL identifier
+
+        Examples:
+            >>> class PlayerStatsScraper(BaseScraper):
+            ...     def _download_page(self, url_slug): ...
+            ...     def download(self): ...
+            ...     def parse(self): ...
+            >>> with PlayerStatsScraper('https://example.com/', 'player_stats') as scraper:
+            ...     scraper._table_name
+            'player_stats'
+            >>> PlayerStatsScraper('https://example.com/', 'bad-name')
+            Traceback (most recent call last):
+                ...
+            ValueError: Invalid table name: 'bad-name'
+            >>> PlayerStatsScraper('https://example.com/', 't; DROP TABLE x')
+            Traceback (most recent call last):
+                ...
+            ValueError: Invalid table name: 't; DROP TABLE x'
         """
         self._base_url = base_url
-        # TODO validate table name
+        # The table name is formatted directly into SQL statements
+        if not _IDENTIFIER_RE.fullmatch(table_name):
+            raise ValueError(f"Invalid table name: {table_name!r}")
         self._table_name = table_name
         self._df: pd.DataFrame = pd.DataFrame()
+        # One keep-alive connection pool shared by every page download
+        self._session = requests.Session()
+        self._pool_size = 0
+        self._size_connection_pool(_MAX_DOWNLOAD_WORKERS)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the HTTP session and its pooled connections"""
+        self._session.close()
+
+    def _size_connection_pool(self, pool_size: int):
+        """Make the session keep at least pool_size connections per host
+
+        Args:
+            pool_size (int): Number of connections to keep alive per host
+        """
+        if pool_size <= self._pool_size:
+            return
+        adapter = HTTPAdapter(pool_maxsize=pool_size)
+        # Closes the adapters being replaced
+        self._session.close()
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        self._pool_size = pool_size
 
     def _cache_html(self, html_content: str, url_slug: str):
         """Cache the html content. The file saving the contents
@@ -27,8 +92,35 @@ class BaseScraper(ABC):
             html_content (str): The HTML content
             url_slug (str): The part of the url that comes after self.base_url
         """
-        with open(html_cache_path(url_slug), "+a") as f:
-            f.write(html_content)
+        path = html_cache_path(self._base_url + url_slug)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and swap it in, so an interrupted write never
+        # leaves a truncated page in the cache
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with open(fd, 'w', encoding='utf-8') as f:
+                f.write(html_content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _cached_html(self, url_slug: str, force_refresh: bool = False) -> str | None:
+        """Get html content saved by self._cache_html, if any
+
+        Args:
+            url_slug (str): The part of the url that comes after self.base_url
+            force_refresh (bool, optional): Ignore the cached page so it is
+                downloaded (and cached) again
+
+        Returns:
+            str | None: The cached HTML content, or None if the page has not
+                been cached or force_refresh is set
+        """
+        path = html_cache_path(self._base_url + url_slug)
+        if not force_refresh and path.exists():
+            return path.read_text(encoding='utf-8')
+        return None
 
     def _stage_row(self, data: dict | pd.DataFrame, replace_filter: str = ''):
         """Save row of data into the staging database.
@@ -41,11 +133,11 @@ class BaseScraper(ABC):
         """
         # Remove existing row if replace_filter is provided
         if replace_filter:
-            with engine_staged.connect() as conn:
-                conn.execute(f"DELETE FROM {self._table_name} WHERE {replace_filter}")
+            with database.engine_staged.connect() as conn:
+                conn.execute(text(f"DELETE FROM {self._table_name} WHERE {replace_filter}"))
                 conn.commit()
         
-        pd.DataFrame(data).to_sql(self._table_name, engine_staged)
+        pd.DataFrame(data).to_sql(self._table_name, database.engine_staged)
 
     def clear_staged(self, filter: str = ''):
         """Remove the data from this class' table from the staged DB
@@ -54,8 +146,8 @@ class BaseScraper(ABC):
             filter (str, optional): SQL valid where expression (not including
                 where)
         """
-        with engine_staged.connect() as conn:
-            conn.execute(f"DELETE FROM {self._table_name}{(' WHERE ' + filter) if filter else ''}")
+        with database.engine_staged.connect() as conn:
+            conn.execute(text(f"DELETE FROM {self._table_name}{(' WHERE ' + filter) if filter else ''}"))
             conn.commit()
     
     def df(self, sql_filter: str | None = None, force_refresh: bool = False) -> pd.DataFrame:
@@ -71,20 +163,43 @@ class BaseScraper(ABC):
         if self._df.empty or force_refresh:
             self._df = pd.read_sql(
                 f"select * from {self._table_name}{('where ' + sql_filter) if sql_filter else ''}",
-                engine,
+                database.engine,
             )
         return self._df
 
     @abstractmethod
     def _download_page(self, url_slug: str) -> str:
-        """Download one page's worth of content. **PLEASE** cache the results 
-        with self._cache_html
+        """Download one page's worth of content. **PLEASE** return
+        self._cached_html when it has the page, cache new results with
+        self._cache_html, and make requests through self._session so
+        connections are reused across pages
 
         Args:
             url_slug (str): the unique part of the url after self.base_url
         """
         pass
 
+    def _download_pages(self, url_slugs: list[str], max_workers: int = _MAX_DOWNLOAD_WORKERS) -> dict[str, str]:
+        """Download several pages concurrently with self._download_page.
+
+        Downloading is network bound, so overlapping requests in threads
+        cuts total time roughly by max_workers. Keep max_workers within the
+        site's rate limit.
+
+        Args:
+            url_slugs (list[str]): the unique parts of the urls after
+                self.base_url
+            max_workers (int, optional): Maximum concurrent downloads.
+                Defaults to 8.
+
+        Returns:
+            dict[str, str]: Page content keyed by url slug
+        """
+        # A pool smaller than max_workers would discard connections
+        self._size_connection_pool(max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(url_slugs, executor.map(self._download_page, url_slugs)))
+
     @abstractmethod
     def download(self) -> str:
         """Top level function to download all content in all pages needed for
@@ -98,14 +213,38 @@ class BaseScraper(ABC):
         pass
 
     def persist(self):
-        """Persist the staged data into the production database"""
-        with engine_staged.connect() as staged_conn:
-            staged_data = pd.read_sql(f"SELECT * FROM {self._table_name}", staged_conn)
-        
-        with engine.connect() as prod_conn:
-            staged_data.to_sql(self._table_name, prod_conn, if_exists='append', index=False)
-            prod_conn.commit()
+        """Persist the staged data into the production database.
 
-        with engine_staged.connect() as staged_conn:
-            staged_conn.execute(f"DELETE FROM {self._table_name}")
-            staged_conn.commit()
\ No newline at end of file
+        Each database gets a single transaction, and the staged rows are
+        only removed once the production write has committed. Only the rows
+        that were read are removed, so rows staged by other connections in
+        the meantime are kept for the next persist.
+        """
+        with database.engine_staged.begin() as staged_conn:
+            # pysqlite doesn't BEGIN before a SELECT, so the read is not
+            # isolated from the DELETE; bound both by rowid instead
+            max_rowid = staged_conn.execute(text(f"SELECT max(rowid) FROM {self._table_name}")).scalar()
+            staged_data = pd.read_sql(
+                text(f"SELECT * FROM {self._table_name} WHERE rowid <= :max_rowid"),
+                staged_conn,
+                params={'max_rowid': max_rowid},
+            )
+
+            with database.engine.begin() as prod_conn:
+                if prod_conn.dialect.driver == 'psycopg2':
+                    # COPY streams all rows in one round trip
+                    insert_options = {'method': database.copy_insert}
+                else:
+                    insert_options = {'method': 'multi', 'chunksize': _INSERT_CHUNK_SIZE}
+                staged_data.to_sql(
+                    self._table_name,
+                    prod_conn,
+                    if_exists='append',
+                    index=False,
+                    **insert_options,
+                )
+
+            staged_conn.execute(
+                text(f"DELETE FROM {self._table_name} WHERE rowid <= :max_rowid"),
+                {'max_rowid': max_rowid},
+            )
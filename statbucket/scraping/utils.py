@@ -1,10 +1,28 @@
-def html_cache_path(url: str):
+from hashlib import blake2b
+from pathlib import Path
+
+HTML_CACHE_DIR = Path("html_cache")
+"""Directory holding downloaded HTML pages"""
+
+
+def html_cache_path(url: str) -> Path:
     """Get the path of the cached HTML file for a given URL.
 
+    The file name is a hash of the full URL, so the same page always maps to
+    the same file and reruns can read it instead of downloading it again.
+
     Args:
         url (str): URL of the HTML content's source.
 
-    Raises:
-        NotImplementedError: Needs to be implemented.
+    Returns:
+        Path: Location of the cached HTML file (it may not exist yet)
+
+    Examples:
+        >>> url = 'https://www.basketball-reference.com/leagues/NBA_2024.html'
+        >>> html_cache_path(url) == html_cache_path(url)
+        True
+        >>> html_cache_path(url).suffix
+        '.html'
     """
-    raise NotImplementedError
+    digest = blake2b(url.encode(), digest_size=16).hexdigest()
+    return HTML_CACHE_DIR / f"{digest}.html"